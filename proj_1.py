@@ -2,7 +2,22 @@ from __future__ import annotations
 from abc import ABC, abstractmethod
 from decimal import Decimal, ROUND_HALF_UP
 import datetime
-from functools import total_ordering
+import sys
+from typing import NamedTuple
+
+# Normalized currency codes, interned so equal codes share one string object
+_CCY_CACHE: dict[str, str] = {}
+
+def _intern_currency(currency: str) -> str:
+    """Return the interned upper-case form of a currency code."""
+    cached = _CCY_CACHE.get(currency)
+    if cached is None:
+        cached = _CCY_CACHE[currency] = sys.intern(currency.upper())
+    return cached
+
+def _div_half_up(numerator: int, denominator: int) -> int:
+    """Integer division of non-negative values, rounded half-up."""
+    return (2 * numerator + denominator) // (2 * denominator)
 
 # --- Added Missing Classes ---
 
@@ -10,62 +25,139 @@ class IncompatibleCurrencyError(ValueError):
     """Raised when an operation is attempted on two different currencies."""
     pass
 
-@total_ordering
 class AdvancedMoney:
     """
     A class to represent a monetary value with a specific currency.
     Handles currency-safe arithmetic and comparisons.
     """
+    __slots__ = ('_cents', '_currency', '_str_cache')
+
+    _ROUND = ROUND_HALF_UP
+
     def __init__(self, amount: str | Decimal | int, currency: str = 'USD'):
-        # Quantize to 2 decimal places, standard for most currencies
-        self.amount = Decimal(amount).quantize(Decimal('0.01'), rounding=ROUND_HALF_UP)
-        self.currency = currency.upper()
+        # Store whole minor units (cents), rounded half-up, standard for most currencies
+        if not isinstance(amount, Decimal):
+            amount = Decimal(amount)
+        self._cents = int((amount * 100).to_integral_value(rounding=AdvancedMoney._ROUND))
+        self._currency = _intern_currency(currency)
+
+    @classmethod
+    def _from_cents(cls, cents: int, currency: str) -> AdvancedMoney:
+        """Build an instance from a count of cents and a normalized currency."""
+        obj = cls.__new__(cls)
+        obj._cents = cents
+        obj._currency = currency
+        return obj
+
+    def __getstate__(self) -> tuple[dict | None, dict]:
+        # Same (__dict__, slots) shape as the default, but usable by every protocol
+        slots = {}
+        for klass in type(self).__mro__:
+            names = klass.__dict__.get('__slots__', ())
+            if isinstance(names, str):
+                names = (names,)
+            for name in names:
+                if name not in ('__dict__', '__weakref__') and hasattr(self, name):
+                    slots[name] = getattr(self, name)
+        return getattr(self, '__dict__', None), slots
+
+    def __setstate__(self, state: tuple[dict | None, dict]) -> None:
+        attrs, slots = state
+        if attrs:
+            self.__dict__.update(attrs)
+        for name, value in slots.items():
+            setattr(self, name, value)
+        # Unpickled strings are not interned; restore that for identity checks
+        self._currency = _intern_currency(self._currency)
+
+    @property
+    def currency(self) -> str:
+        """The normalized currency code; read-only so cached output stays valid."""
+        return self._currency
+
+    @property
+    def amount(self) -> Decimal:
+        """The value as a Decimal with 2 decimal places."""
+        return Decimal(self._cents).scaleb(-2)
 
     def __repr__(self) -> str:
-        return f"{self.__class__.__name__}('{self.amount}', '{self.currency}')"
+        return f"{self.__class__.__name__}('{self.amount}', '{self._currency}')"
 
     def __str__(self) -> str:
-        return f"{self.currency} {self.amount:,.2f}"
+        # Values never change after construction, so format once on first use
+        try:
+            return self._str_cache
+        except AttributeError:
+            pass
+        sign = '-' if self._cents < 0 else ''
+        units, cents = divmod(abs(self._cents), 100)
+        self._str_cache = f"{self._currency} {sign}{units:,}.{cents:02d}"
+        return self._str_cache
 
     def _check_currency(self, other: AdvancedMoney) -> None:
-        if not isinstance(other, AdvancedMoney):
+        # Exact-type check first; isinstance only for balance subclasses
+        if type(other) is not AdvancedMoney and not isinstance(other, AdvancedMoney):
             raise TypeError(f"Cannot operate on AdvancedMoney and {type(other)}")
-        if self.currency != other.currency:
+        # Currency codes are interned, so identity is equality
+        if self._currency is not other._currency:
             raise IncompatibleCurrencyError(
-                f"Currency mismatch: {self.currency} and {other.currency}"
+                f"Currency mismatch: {self._currency} and {other._currency}"
             )
 
     def __add__(self, other: AdvancedMoney) -> AdvancedMoney:
         self._check_currency(other)
-        return AdvancedMoney(self.amount + other.amount, self.currency)
+        return AdvancedMoney._from_cents(self._cents + other._cents, self._currency)
 
     def __sub__(self, other: AdvancedMoney) -> AdvancedMoney:
         self._check_currency(other)
-        return AdvancedMoney(self.amount - other.amount, self.currency)
+        return AdvancedMoney._from_cents(self._cents - other._cents, self._currency)
 
-    def __mul__(self, other: int | Decimal | float) -> AdvancedMoney:
-        if not isinstance(other, (int, Decimal, float)):
-            return NotImplemented
-        return AdvancedMoney(self.amount * Decimal(other), self.currency)
+    def __mul__(self, other: int | Decimal) -> AdvancedMoney:
+        t = type(other)
+        if t is int:
+            return AdvancedMoney._from_cents(self._cents * other, self._currency)
+        if t is not Decimal:
+            if t is float:
+                raise TypeError("Cannot multiply money by a float; use int or Decimal")
+            if not isinstance(other, (int, Decimal)):
+                return NotImplemented
+        # Fractional factors go through Decimal so the result is rounded once
+        return AdvancedMoney(self.amount * other, self._currency)
 
-    def __rmul__(self, other: int | Decimal | float) -> AdvancedMoney:
+    def __rmul__(self, other: int | Decimal) -> AdvancedMoney:
         return self.__mul__(other)
-        
-    def __truediv__(self, other: int | Decimal | float) -> AdvancedMoney:
-        if not isinstance(other, (int, Decimal, float)):
-            return NotImplemented
+
+    def __truediv__(self, other: int | Decimal) -> AdvancedMoney:
+        t = type(other)
+        if t is not int and t is not Decimal:
+            if t is float:
+                raise TypeError("Cannot divide money by a float; use int or Decimal")
+            if not isinstance(other, (int, Decimal)):
+                return NotImplemented
         if other == 0:
             raise ZeroDivisionError("Cannot divide money by zero")
-        return AdvancedMoney(self.amount / Decimal(other), self.currency)
+        return AdvancedMoney(self.amount / Decimal(other), self._currency)
 
     def __eq__(self, other: object) -> bool:
-        if not isinstance(other, AdvancedMoney):
+        if type(other) is not AdvancedMoney and not isinstance(other, AdvancedMoney):
             return NotImplemented
-        return self.amount == other.amount and self.currency == other.currency
+        return self._cents == other._cents and self._currency is other._currency
+
+    def __lt__(self, other: AdvancedMoney) -> bool:
+        self._check_currency(other)
+        return self._cents < other._cents
+
+    def __le__(self, other: AdvancedMoney) -> bool:
+        self._check_currency(other)
+        return self._cents <= other._cents
 
     def __gt__(self, other: AdvancedMoney) -> bool:
         self._check_currency(other)
-        return self.amount > other.amount
+        return self._cents > other._cents
+
+    def __ge__(self, other: AdvancedMoney) -> bool:
+        self._check_currency(other)
+        return self._cents >= other._cents
         
 # --- Your Original Code (Rewritten and Fixed) ---
 
@@ -85,8 +177,10 @@ class PaymentMethod(ABC):
 class CreditCardPayment(PaymentMethod):
     """Credit card payment processing"""
     
-    def __init__(self, fee_rate: Decimal = Decimal('0.029')):  # 2.9% fee
-        self.fee_rate = fee_rate
+    def __init__(self, fee_bps: int = 290):  # 2.9% fee, in basis points
+        if type(fee_bps) is not int:
+            raise TypeError(f"fee_bps must be an int number of basis points, not {type(fee_bps)}")
+        self.fee_bps = fee_bps
     
     def process_payment(self, amount: AdvancedMoney) -> bool:
         """Process credit card payment"""
@@ -95,8 +189,11 @@ class CreditCardPayment(PaymentMethod):
     
     def get_fees(self, amount: AdvancedMoney) -> AdvancedMoney:
         """Calculate credit card processing fee"""
-        fee_amount = amount * self.fee_rate
-        return AdvancedMoney(fee_amount.amount, amount.currency)
+        # Round the magnitude half-up, then restore the sign (ROUND_HALF_UP semantics)
+        fee_cents = _div_half_up(abs(amount._cents) * self.fee_bps, 10000)
+        if amount._cents < 0:
+            fee_cents = -fee_cents
+        return AdvancedMoney._from_cents(fee_cents, amount.currency)
 
 class BankTransferPayment(PaymentMethod):
     """Bank transfer payment processing"""
@@ -111,118 +208,212 @@ class BankTransferPayment(PaymentMethod):
     
     def get_fees(self, amount: AdvancedMoney) -> AdvancedMoney:
         """Calculate bank transfer fee"""
-        if amount.currency != self.flat_fee.currency:
+        if amount.currency is not self.flat_fee.currency:
             raise IncompatibleCurrencyError("Currency mismatch for fee calculation")
         return self.flat_fee
 
+class TxRecord(NamedTuple):
+    """A single entry in an account's transaction history."""
+    type: str
+    amount: AdvancedMoney
+    description: str
+    timestamp: datetime.datetime
+    balance_after: AdvancedMoney
+    gain_loss: AdvancedMoney | None = None
+
+class _TransactionNode:
+    """One entry in a persistent, newest-first transaction history."""
+
+    __slots__ = ('entry', 'parent')
+
+    def __init__(self, entry: TxRecord, parent: _TransactionNode | None):
+        self.entry = entry
+        self.parent = parent
+
 class AccountBalance(AdvancedMoney):
     """Money subclass for account balances with transaction history"""
     
+    __slots__ = ('account_type', '_history', 'created_date')
+
     def __init__(self, amount, currency='USD', account_type='checking'):
         super().__init__(amount, currency)
         self.account_type = account_type
-        self.transactions: list[dict] = []
+        # Balances share history with their predecessors; each one only adds a node
+        self._history: _TransactionNode | None = None
         self.created_date = datetime.datetime.now()
+
+    @classmethod
+    def _from_cents(cls, cents: int, currency: str, account_type: str = 'checking') -> AccountBalance:
+        """Build a balance without __init__; the caller copies remaining state over."""
+        obj = super()._from_cents(cents, currency)
+        obj.account_type = account_type
+        return obj
     
     def _copy_state_to(self, new_instance: AccountBalance):
         """Helper to copy state for the immutable pattern."""
-        new_instance.transactions = self.transactions.copy()
+        new_instance._history = self._history
         new_instance.created_date = self.created_date
+
+    def _record(self, entry: TxRecord) -> None:
+        """Append a transaction without touching the shared history."""
+        self._history = _TransactionNode(entry, self._history)
+
+    def __getstate__(self) -> tuple[dict | None, dict]:
+        attrs, slots = super().__getstate__()
+        # Pickle history as a flat list; the linked nodes would recurse per entry
+        slots['_history'] = self.get_transaction_history(None)
+        return attrs, slots
+
+    def __setstate__(self, state: tuple[dict | None, dict]) -> None:
+        attrs, slots = state
+        slots = dict(slots)
+        history = slots.pop('_history', ())
+        super().__setstate__((attrs, slots))
+        self._history = None
+        for entry in history:
+            self._record(entry)
+
+    @property
+    def transactions(self) -> list[TxRecord]:
+        """Full transaction history, oldest first"""
+        return self.get_transaction_history(None)
     
-    def deposit(self, amount: AdvancedMoney, description: str = "Deposit") -> AccountBalance:
-        """Make a deposit"""
-        if amount.currency != self.currency:
-            raise IncompatibleCurrencyError(f"Cannot deposit {amount.currency} to {self.currency}")
-        
+    def _apply_delta(self, delta_cents: int, tx_type: str, amount: AdvancedMoney,
+                     description: str, timestamp: datetime.datetime) -> AccountBalance:
+        """Return a new balance moved by delta_cents with one transaction recorded.
+
+        Callers are responsible for currency and funds checks.
+        """
         # **FIX:** Use `self.__class__` to create an instance of the
         # correct subclass (e.g., AccountBalance or InvestmentBalance)
-        new_balance = self.__class__(
-            self.amount + amount.amount, 
-            self.currency, 
-            self.account_type
-        )
+        new_cents = self._cents + delta_cents
+        new_balance = self.__class__._from_cents(new_cents, self.currency, self.account_type)
         # **FIX:** Copy state to the new instance
         self._copy_state_to(new_balance)
         
-        new_balance.transactions.append({
-            'type': 'deposit',
-            'amount': amount,
-            'description': description,
-            'timestamp': datetime.datetime.now(),
-            'balance_after': new_balance
-        })
+        new_balance._record(TxRecord(
+            tx_type,
+            amount,
+            description,
+            timestamp,
+            # A plain money snapshot; the balance itself would pin its whole history
+            AdvancedMoney._from_cents(new_cents, self.currency)
+        ))
         return new_balance
     
-    def withdraw(self, amount: AdvancedMoney, description: str = "Withdrawal") -> AccountBalance:
-        """Make a withdrawal"""
-        if amount.currency != self.currency:
+    def deposit(self, amount: AdvancedMoney, description: str = "Deposit",
+                timestamp: datetime.datetime | None = None) -> AccountBalance:
+        """Make a deposit (timestamp defaults to now)"""
+        if amount.currency is not self.currency:
+            raise IncompatibleCurrencyError(f"Cannot deposit {amount.currency} to {self.currency}")
+        
+        return self._apply_delta(
+            amount._cents, 'deposit', amount, description,
+            timestamp or datetime.datetime.now()
+        )
+    
+    def withdraw(self, amount: AdvancedMoney, description: str = "Withdrawal",
+                 timestamp: datetime.datetime | None = None) -> AccountBalance:
+        """Make a withdrawal (timestamp defaults to now)"""
+        if amount.currency is not self.currency:
             raise IncompatibleCurrencyError(f"Cannot withdraw {amount.currency} from {self.currency}")
         
         if amount > self: # `self` works as AdvancedMoney
             raise ValueError("Insufficient funds")
         
-        # **FIX:** Use `self.__class__`
-        new_balance = self.__class__(
-            self.amount - amount.amount, 
-            self.currency, 
-            self.account_type
+        return self._apply_delta(
+            -amount._cents, 'withdrawal', amount, description,
+            timestamp or datetime.datetime.now()
         )
-        # **FIX:** Copy state to the new instance
-        self._copy_state_to(new_balance)
-        
-        new_balance.transactions.append({
-            'type': 'withdrawal',
-            'amount': amount,
-            'description': description,
-            'timestamp': datetime.datetime.now(),
-            'balance_after': new_balance
-        })
-        return new_balance
     
     def transfer_to(self, target_account: AccountBalance, amount: AdvancedMoney, 
-                    description: str = "Transfer") -> tuple[AccountBalance, AccountBalance]:
+                    description: str = "Transfer",
+                    timestamp: datetime.datetime | None = None) -> tuple[AccountBalance, AccountBalance]:
         """Transfer money to another account"""
-        if amount.currency != self.currency or amount.currency != target_account.currency:
+        if amount.currency is not self.currency or amount.currency is not target_account.currency:
             raise IncompatibleCurrencyError("Currency mismatch for transfer")
         
+        if amount > self:
+            raise ValueError("Insufficient funds")
+        
+        # Both sides of the transfer share one timestamp
+        timestamp = timestamp or datetime.datetime.now()
+
         # Withdraw from source
-        new_source_balance = self.withdraw(amount, f"Transfer to {target_account.account_type}")
+        new_source_balance = self._apply_delta(
+            -amount._cents, 'withdrawal', amount,
+            f"Transfer to {target_account.account_type}", timestamp
+        )
         
         # Deposit to target
-        new_target_balance = target_account.deposit(amount, f"Transfer from {self.account_type}")
+        new_target_balance = target_account._apply_delta(
+            amount._cents, 'deposit', amount,
+            f"Transfer from {self.account_type}", timestamp
+        )
         
         return new_source_balance, new_target_balance
     
-    def get_transaction_history(self, limit: int = 10) -> list[dict]:
+    def get_transaction_history(self, limit: int | None = 10) -> list[TxRecord]:
         """Get recent transaction history"""
-        return self.transactions[-limit:]
+        history = []
+        node = self._history
+        while node is not None and (limit is None or len(history) < limit):
+            history.append(node.entry)
+            node = node.parent
+        history.reverse()
+        return history
     
     def calculate_interest(self, annual_rate: Decimal, days: int = 30) -> AdvancedMoney:
         """Calculate interest for account (savings accounts)"""
         if self.account_type not in ['savings', 'money_market']:
             return AdvancedMoney('0', self.currency)
         
-        daily_rate = annual_rate / Decimal('365')
-        interest_amount = self.amount * daily_rate * Decimal(days)
+        # Work from cents with a single division so rounding happens once
+        interest_amount = Decimal(self._cents) * annual_rate * days / 36500
         return AdvancedMoney(interest_amount, self.currency)
 
 class InvestmentBalance(AccountBalance):
     """Specialized balance for investment accounts"""
     
+    __slots__ = ('_holdings', '_cost_cents')
+
     def __init__(self, amount, currency='USD'):
         super().__init__(amount, currency, 'investment')
-        self.holdings: dict[str, int] = {}  # symbol -> quantity
-        self.cost_basis: dict[str, AdvancedMoney] = {}  # symbol -> average cost
+        self._holdings: dict[str, int] = {}  # symbol -> quantity
+        self._cost_cents: dict[str, int] = {}  # symbol -> total cost in cents
+
+    @property
+    def holdings(self) -> dict[str, int]:
+        """Shares held per symbol (a copy; the underlying dict may be shared)"""
+        return dict(self._holdings)
+
+    @property
+    def cost_basis(self) -> dict[str, AdvancedMoney]:
+        """Average cost per share for each holding"""
+        return {
+            symbol: AdvancedMoney(Decimal(cents) / self._holdings[symbol] / 100, self.currency)
+            for symbol, cents in self._cost_cents.items()
+        }
     
     def _copy_state_to(self, new_instance: AccountBalance):
         """Copy base state and investment-specific state."""
         super()._copy_state_to(new_instance)
         if isinstance(new_instance, InvestmentBalance):
-            new_instance.holdings = self.holdings.copy()
-            new_instance.cost_basis = self.cost_basis.copy()
+            # Shared until a trade changes them, see _own_positions
+            new_instance._holdings = self._holdings
+            new_instance._cost_cents = self._cost_cents
+
+    def _own_positions(self) -> None:
+        """Give this instance private copies of holdings before mutating them."""
+        self._holdings = self._holdings.copy()
+        self._cost_cents = self._cost_cents.copy()
     
-    def buy_stock(self, symbol: str, quantity: int, price_per_share: AdvancedMoney) -> InvestmentBalance:
+    def buy_stock(self, symbol: str, quantity: int, price_per_share: AdvancedMoney,
+                  timestamp: datetime.datetime | None = None) -> InvestmentBalance:
         """Buy stock"""
+        if quantity <= 0:
+            raise ValueError("Share quantity must be positive")
+        
         total_cost = price_per_share * quantity
         
         if total_cost > self:
@@ -230,69 +421,79 @@ class InvestmentBalance(AccountBalance):
         
         # **FIX:** `self.withdraw` now correctly returns an `InvestmentBalance`
         # We type-cast here to help static analysis, though it's guaranteed
-        new_balance = self.withdraw(total_cost, f"Buy {quantity} shares of {symbol}")
+        new_balance = self.withdraw(total_cost, f"Buy {quantity} shares of {symbol}", timestamp)
         assert isinstance(new_balance, InvestmentBalance)
 
         # Update holdings
-        if symbol in new_balance.holdings:
-            old_quantity = new_balance.holdings[symbol]
-            old_cost_basis = new_balance.cost_basis[symbol]
-            
-            # Calculate new average cost
-            total_shares = old_quantity + quantity
-            total_cost_basis = (old_quantity * old_cost_basis) + total_cost
-            new_cost_basis = total_cost_basis / total_shares
-            
-            new_balance.holdings[symbol] = total_shares
-            new_balance.cost_basis[symbol] = new_cost_basis
-        else:
-            new_balance.holdings[symbol] = quantity
-            new_balance.cost_basis[symbol] = price_per_share
+        new_balance._own_positions()
+        # Keep a running total cost; the average is derived on demand
+        holdings = new_balance._holdings
+        cost_cents = new_balance._cost_cents
+        holdings[symbol] = holdings.get(symbol, 0) + quantity
+        cost_cents[symbol] = cost_cents.get(symbol, 0) + total_cost._cents
         
         return new_balance
     
-    def sell_stock(self, symbol: str, quantity: int, price_per_share: AdvancedMoney) -> InvestmentBalance:
+    def sell_stock(self, symbol: str, quantity: int, price_per_share: AdvancedMoney,
+                   timestamp: datetime.datetime | None = None) -> InvestmentBalance:
         """Sell stock"""
-        if symbol not in self.holdings or self.holdings[symbol] < quantity:
+        if quantity <= 0:
+            raise ValueError("Share quantity must be positive")
+        
+        held = self._holdings.get(symbol, 0)
+        if held < quantity:
             raise ValueError(f"Insufficient shares of {symbol}")
         
         total_proceeds = price_per_share * quantity
         
         # **FIX:** `self.deposit` now correctly returns an `InvestmentBalance`
-        new_balance = self.deposit(total_proceeds, f"Sell {quantity} shares of {symbol}")
+        new_balance = self.deposit(total_proceeds, f"Sell {quantity} shares of {symbol}", timestamp)
         assert isinstance(new_balance, InvestmentBalance)
 
+        # Share of the total cost attributable to the shares sold
+        original_cost_cents = _div_half_up(
+            self._cost_cents[symbol] * quantity, held
+        )
+
         # Update holdings
-        new_balance.holdings[symbol] -= quantity
-        if new_balance.holdings[symbol] == 0:
-            del new_balance.holdings[symbol]
-            del new_balance.cost_basis[symbol]
+        new_balance._own_positions()
+        remaining = held - quantity
+        if remaining == 0:
+            del new_balance._holdings[symbol]
+            del new_balance._cost_cents[symbol]
+        else:
+            new_balance._holdings[symbol] = remaining
+            new_balance._cost_cents[symbol] -= original_cost_cents
         
         # Calculate gain/loss
-        original_cost = self.cost_basis[symbol] * quantity
-        # **FIX:** Corrected calculation (was `AdvancedMoney(original_cost.amount, ...)`
-        gain_loss = total_proceeds - original_cost
+        gain_loss = AdvancedMoney._from_cents(
+            total_proceeds._cents - original_cost_cents, self.currency
+        )
         
-        new_balance.transactions[-1]['gain_loss'] = gain_loss
+        last = new_balance._history
+        new_balance._history = _TransactionNode(
+            last.entry._replace(gain_loss=gain_loss), last.parent
+        )
         
         return new_balance
     
     def get_portfolio_value(self, current_prices: dict[str, AdvancedMoney]) -> AdvancedMoney:
         """Calculate total portfolio value"""
         # **FIX:** This was an indentation error
-        cash_value = AdvancedMoney(self.amount, self.currency)
-        stock_value = AdvancedMoney('0', self.currency)
-        
-        for symbol, quantity in self.holdings.items():
-            if symbol in current_prices:
-                stock_value += current_prices[symbol] * quantity
+        # Accumulate in integer cents and build a single result at the end
+        total_cents = self._cents
+        for symbol, quantity in self._holdings.items():
+            price = current_prices.get(symbol)
+            if price is not None:
+                self._check_currency(price)
+                total_cents += price._cents * quantity
         
-        return cash_value + stock_value
+        return AdvancedMoney._from_cents(total_cents, self.currency)
 
 # --- Demonstration Code ---
 
-if __name__ == "__main__":
-    
+def main():
+    """Run the account and payment demonstration."""
     print("=== Money Inheritance Hierarchy ===")
     # Create accounts
     checking = AccountBalance('1000.00', 'USD', 'checking')
@@ -332,9 +533,9 @@ if __name__ == "__main__":
     print(f"\nRecent transactions for {investment.account_type}:")
     for i, transaction in enumerate(investment.get_transaction_history(3), 1):
         # **FIX:** Corrected cut-off f-string
-        print(f"{i}. {transaction['type'].title()}: {transaction['amount']} - {transaction['description']}")
-        if 'gain_loss' in transaction:
-            print(f"   Gain/Loss: {transaction['gain_loss']}")
+        print(f"{i}. {transaction.type.title()}: {transaction.amount} - {transaction.description}")
+        if transaction.gain_loss is not None:
+            print(f"   Gain/Loss: {transaction.gain_loss}")
     
     # Payment processing demonstration
     print(f"\n=== Payment Processing ===")
@@ -362,4 +563,7 @@ if __name__ == "__main__":
     # Portfolio valuation
     current_prices = {'AAPL': AdvancedMoney('165.00', 'USD')}
     portfolio_value = investment.get_portfolio_value(current_prices)
-    print(f"Total portfolio value: {portfolio_value}")
\ No newline at end of file
+    print(f"Total portfolio value: {portfolio_value}")
+
+if __name__ == "__main__":
+    main()